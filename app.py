@@ -9,6 +9,12 @@ from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
 import pickle
 import json
+import base64
+import hashlib
+import time
+import threading
+from collections import OrderedDict
+from xml.sax.saxutils import escape
 
 # Improved NLTK resource download function
 def download_nltk_resources():
@@ -379,6 +385,99 @@ def get_mentor_recommendations(user_preferences, mentors_df, encoder, encoded_me
     
     return recommended_mentors
 
+# -- MENTOR AVATARS --
+
+# Background colors for generated avatars
+AVATAR_COLORS = [
+    '#1E88E5', '#43A047', '#E53935', '#8E24AA', '#FB8C00',
+    '#00897B', '#3949AB', '#D81B60', '#6D4C41', '#546E7A'
+]
+
+# Maximum number of avatars kept in memory
+AVATAR_CACHE_SIZE = 256
+
+# Function to render an initials avatar as an SVG string
+def render_avatar_svg(name, size=100):
+    parts = name.split()
+    initials = ''.join(part[0] for part in parts[:2]).upper() if parts else '?'
+    digest = hashlib.sha1(name.encode('utf-8')).hexdigest()
+    color = AVATAR_COLORS[int(digest, 16) % len(AVATAR_COLORS)]
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" viewBox="0 0 100 100">'
+        f'<rect width="100" height="100" fill="{color}"/>'
+        f'<text x="50" y="50" dy=".35em" text-anchor="middle" fill="#FFFFFF" '
+        f'font-family="Arial, Helvetica, sans-serif" font-size="40" font-weight="bold">{escape(initials)}</text>'
+        f'</svg>'
+    )
+
+# Bounded LRU cache of rendered avatars keyed by mentor ID
+class AvatarCache:
+    def __init__(self, max_size=AVATAR_CACHE_SIZE):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.prerendered = 0
+        self.renders = 0
+        self.render_time = 0.0
+        # Shared across Streamlit sessions, which run in separate threads
+        self.lock = threading.Lock()
+
+    # Render an avatar as a data URI and store it, evicting the least recently used entries
+    def _render(self, mentor_id, name, content_key):
+        start = time.perf_counter()
+        svg = render_avatar_svg(name)
+        # Base64 data URI so '#' in colors isn't read as a URL fragment by st.image
+        data_uri = "data:image/svg+xml;base64," + base64.b64encode(svg.encode('utf-8')).decode('ascii')
+        self.render_time += time.perf_counter() - start
+        self.renders += 1
+
+        self.entries[mentor_id] = (content_key, data_uri)
+        self.entries.move_to_end(mentor_id)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+        return data_uri
+
+    def get(self, mentor_id, name):
+        # Entries are tagged with a hash of the name so a renamed mentor is re-rendered
+        content_key = hashlib.sha1(name.encode('utf-8')).hexdigest()
+        with self.lock:
+            entry = self.entries.get(mentor_id)
+            if entry is not None and entry[0] == content_key:
+                self.hits += 1
+                self.entries.move_to_end(mentor_id)
+                return entry[1]
+
+            self.misses += 1
+            return self._render(mentor_id, name, content_key)
+
+    # Warm the cache without counting towards the hit rate
+    def prerender(self, mentors_df):
+        with self.lock:
+            for mentor_id, name in zip(mentors_df['mentor_id'], mentors_df['name']):
+                content_key = hashlib.sha1(name.encode('utf-8')).hexdigest()
+                self._render(mentor_id, name, content_key)
+                self.prerendered += 1
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self.entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'prerendered': self.prerendered,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'avg_render_ms': (self.render_time / self.renders * 1000) if self.renders else 0.0
+            }
+
+# Shared avatar cache, pre-rendered for the whole mentor roster
+@st.cache_resource
+def load_avatar_cache(mentors_df):
+    cache = AvatarCache()
+    cache.prerender(mentors_df)
+    return cache
+
 # -- CHATBOT FOR CLAT QUERIES --
 
 # Modified text preprocessing function with better error handling
@@ -450,6 +549,7 @@ def get_response(query, knowledge_base):
 # Load data
 mentors_df = load_mentor_data()
 knowledge_base = load_clat_knowledge_base()
+avatar_cache = load_avatar_cache(mentors_df)
 
 # Preprocess mentor data for recommendation
 encoder, encoded_mentors, feature_names = preprocess_mentor_data(mentors_df)
@@ -540,7 +640,7 @@ with tab1:
                     col1, col2 = st.columns([1, 3])
                     
                     with col1:
-                        st.image(f"https://api.dicebear.com/7.x/initials/svg?seed={mentor['name']}", width=100)
+                        st.image(avatar_cache.get(mentor['mentor_id'], mentor['name']), width=100)
                         st.write(f"**Match: {mentor['match_percentage']:.1f}%**")
                         
                     with col2:
@@ -646,6 +746,8 @@ st.sidebar.divider()
 st.sidebar.subheader("System Information")
 st.sidebar.write("Version: 1.0.0")
 st.sidebar.write("Last updated: April 2025")
+avatar_stats = avatar_cache.stats()
+st.sidebar.write(f"Avatar cache: {avatar_stats['size']} cached ({avatar_stats['prerendered']} pre-rendered) | Hit rate: {avatar_stats['hit_rate']:.0%} | Avg render: {avatar_stats['avg_render_ms']:.2f} ms")
 
 # Feedback section
 st.sidebar.divider()